@@ -395,14 +395,18 @@ class Home(App):
         else:
             filtered_tasks = self.tasks
 
-        # Mount filtered task cards
+        # Build filtered task cards
+        task_cards = []
         for idx, task in enumerate(filtered_tasks):
             # Use a more unique ID that includes a timestamp or random component to prevent conflicts
             unique_id = f"task-{task['id']}-{hash(str(task['id']) + str(idx) + str(datetime.now().timestamp())) % 10000}"
             task_card = TaskCard(task, id=unique_id, classes="task-card")
             if task.get("status") and task["status"].lower() == "completed":
                 task_card.add_class("-completed")
-            tasks_scroll.mount(task_card)
+            task_cards.append(task_card)
+
+        # Mount all cards at once so the list is laid out in a single pass
+        tasks_scroll.mount_all(task_cards)
 
         # Update statistics
         total_tasks = len(self.tasks)
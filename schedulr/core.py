@@ -17,6 +17,11 @@ class Database:
                 status TEXT DEFAULT 'Pending'
             )
         """)
+
+        # Index date_time so month range queries don't scan the whole table
+        self.cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_task_date_time ON task(date_time)
+        """)
         
          
         
@@ -72,6 +77,30 @@ class Database:
             print(f"Error getting all tasks: {e}")
             return []
 
+    def get_tasks_for_month(self, year: int, month: int) -> List[Tuple]:
+        """Get all tasks scheduled within a month, ordered by date and time.
+
+        Args:
+            year (int): The year of the month.
+            month (int): The month (1-12).
+
+        Returns:
+            List[Tuple]: A list of tasks in the month, or empty list if error occurs.
+        """
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        start = f"{year:04d}-{month:02d}-01"
+        end = f"{next_year:04d}-{next_month:02d}-01"
+        try:
+            self.cur.execute(
+                "SELECT id, title, date_time, status FROM task "
+                "WHERE date_time >= ? AND date_time < ? ORDER BY date_time, id",
+                (start, end)
+            )
+            return self.cur.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error getting tasks for month: {e}")
+            return []
+
     def get_task_by_id(self, task_id: int) -> Optional[Tuple]:
         """Get a specific task by its ID.
 
@@ -3,162 +3,126 @@ from textual.widgets import Header, Footer, Static, Button, DataTable, Label, In
 from textual.containers import Container, Vertical, Horizontal, ScrollableContainer, VerticalScroll
 from textual.screen import Screen, ModalScreen
 from textual.binding import Binding
-from datetime import date, datetime, timedelta
+from textual.message import Message
+from textual.widget import Widget
+from textual import work
+from textual.worker import get_current_worker
+from datetime import date
 from calendar import monthrange
-from typing import Dict, List
+from functools import lru_cache
+from itertools import groupby
+from typing import Dict, List, Optional, Tuple
 from .core import Database
 
 
-def map_tasks(db_data):
-    """Map database tuple data to list of dictionaries"""
-    tasks = []
-    for i in db_data:
-        # If it's already a dictionary (from your example format), use it directly
-        if isinstance(i, dict):
-            tasks.append(i)
-        else:
-            # If it's a tuple from the database query, map it
-            tasks.append({
-                "id": i[0],
-                "title": i[1],
-                "date_time": i[2],
-                "status": i[3],
-            })
-    return tasks
+# A month spans at most 6 calendar weeks
+CALENDAR_WEEKS = 6
 
+# Column headers of the calendar grid
+WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 
-class TaskModal(ModalScreen):
-    """Modal screen to show all tasks for a specific date"""
-    
-    CSS = """
-    TaskModal {
-        align: center middle;
-    }
-    
-    #modal-container {
-        width: 100%;
-        height: auto;
-        max-height:100%;
-        background: $surface;
-        border: thick $primary;
-        padding: 1;
-    }
-    
-    #modal-header {
-        text-align: center;
-        text-style: bold;
-        color: $accent;
-        padding: 1;
-        background: $primary;
-        border-bottom: solid $primary-lighten-1;
-    }
-    
-    #modal-content {
-        height: 1fr;
-        padding: 1;
-    }
-    
-    .task-item {
-        layout: horizontal;
-        padding: 1;
-        height: auto;
-        min-height: 4;
-        background: $panel;
-        border: solid $primary;
-        align: center middle;
-        margin-bottom: 1;
-    }
-    
-    .task-item.-completed {
-        text-style: strike;
-        opacity: 0.7;
-    }
-    
-    .task-title {
-        text-style: bold;
-    }
-    
-    .task-time {
-        color: $text-muted;
-    }
-    
-    .task-status {
-        padding: 0 1;
-    }
+# Day state classes toggled when a day button is re-used for another date
+DAY_STATE_CLASSES = ("-today", "-other-month", "-has-tasks")
 
-    .task-buttons {
-        width: auto;
-        height: auto;
-        dock: right;
-        margin-left: 1;
-    }
 
-    .edit-button {
-        margin-right: 1;
-        background: $warning;
-    }
+def _map_tuple_tasks(rows):
+    """Map database rows (tuples) to list of dictionaries"""
+    # Status is normalized once here so rendering never has to lower() it
+    return [
+        {
+            "id": r[0],
+            "title": r[1],
+            "date_time": r[2],
+            "status": r[3],
+            "is_completed": (is_completed := (r[3] or "").lower() == "completed"),
+            "status_symbol": "✅" if is_completed else "⏳",
+        }
+        for r in rows
+    ]
 
-    .delete-button {
-        background: $error;
-    }
-    
-    #modal-footer {
-        layout: horizontal;
-        height: auto;
-        padding: 1;
-        align: center middle;
-    }
-    
-    .close-button {
-        width: 15;
-        background: $error;
-        color: $text;
-    }
+
+@lru_cache(maxsize=24)
+def _month_structure(year: int, month: int) -> Tuple[Tuple[Optional[date], ...], ...]:
+    """Weeks of a month as rows of 7 dates, padded with None (cached per month)"""
+    first_ordinal = date(year, month, 1).toordinal()
+    first_day_weekday = date(year, month, 1).weekday()
+    days_in_month = monthrange(year, month)[1]
+    week_count = (first_day_weekday + days_in_month + 6) // 7
+
+    # Place each date directly in its (week, weekday) slot; the rest stay empty
+    weeks = [[None] * 7 for _ in range(week_count)]
+    for i in range(days_in_month):
+        week_index, weekday = divmod(first_day_weekday + i, 7)
+        weeks[week_index][weekday] = date.fromordinal(first_ordinal + i)
+
+    # Tuples, since the cached structure is shared between callers
+    return tuple(tuple(week) for week in weeks)
+
+
+class TaskModal(ModalScreen):
+    """Modal screen to show all tasks for a specific date"""
     
-    .close-button:hover {
-        background: $error-lighten-1;
-    }
-    """
+    CSS_PATH = "styles/task_modal.tcss"
     
     def __init__(self, date_tasks: List[dict], selected_date: date, **kwargs) -> None:
         super().__init__(**kwargs)
         self.date_tasks = date_tasks
         self.selected_date = selected_date
     
+    async def update(self, date_tasks: List[dict], selected_date: date) -> None:
+        """Show another date's tasks, re-using the already composed modal"""
+        self.date_tasks = date_tasks
+        self.selected_date = selected_date
+        if not self.is_mounted:
+            return  # compose() will pick up the new tasks
+
+        self.query_one("#modal-header", Static).update(self.header_text())
+        modal_content = self.query_one("#modal-content", VerticalScroll)
+        await modal_content.remove_children()
+        await modal_content.mount_all(self.create_task_widgets())
+        modal_content.scroll_home(animate=False)
+
+    def header_text(self) -> str:
+        """Title shown at the top of the modal"""
+        return f"Tasks for {self.selected_date.strftime('%A, %B %d, %Y')}"
+
+    def create_task_widgets(self) -> List[Widget]:
+        """Create the task items for the selected date"""
+        if not self.date_tasks:
+            return [Static("No tasks for this day", classes="no-tasks")]
+
+        widgets = []
+        for task in self.date_tasks:
+            # date_time starts with "YYYY-MM-DD ", so slice out the time part
+            dt = task["date_time"]
+            task_time = dt[11:] if dt and len(dt) > 11 else "No time"
+
+            widgets.append(Container(
+                Vertical(
+                    Static(
+                        f"{task['status_symbol']} {task['title']}",
+                        classes="task-title -completed" if task["is_completed"] else "task-title"
+                    ),
+                    Static(
+                        f"Time: {task_time}",
+                        classes="task-time"
+                    ),
+                ),
+                Horizontal(
+                    Button("Edit", variant="warning", classes="edit-button", id=f"edit-{task['id']}"),
+                    Button("Delete", variant="error", classes="delete-button", id=f"delete-{task['id']}"),
+                    classes="task-buttons",
+                ),
+                classes="task-item",
+            ))
+        return widgets
+
     def compose(self) -> ComposeResult:
         with Container(id="modal-container"):
-            yield Static(
-                f"Tasks for {self.selected_date.strftime('%A, %B %d, %Y')}", 
-                id="modal-header"
-            )
+            yield Static(self.header_text(), id="modal-header")
             
             with VerticalScroll(id="modal-content"):
-                if self.date_tasks:
-                    for task in self.date_tasks:
-                        status_symbol = "✅" if task.get("status") and task["status"].lower() == "completed" else "⏳"
-                        task_time = task["date_time"].split(" ")[1] if task["date_time"] else "No time"
-                        
-                        with Container(classes="task-item"):
-                            with Vertical():
-                                if task.get("status") and task["status"].lower() == "completed":
-                                    yield Static(
-                                        f"{status_symbol} {task['title']}",
-                                        classes="task-title -completed"
-                                    )
-                                else:
-                                    yield Static(
-                                        f"{status_symbol} {task['title']}",
-                                        classes="task-title"
-                                    )
-                                yield Static(
-                                    f"Time: {task_time}",
-                                    classes="task-time"
-                                )
-                            with Horizontal(classes="task-buttons"):
-                                yield Button("Edit", variant="warning", classes="edit-button", id=f"edit-{task['id']}")
-                                yield Button("Delete", variant="error", classes="delete-button", id=f"delete-{task['id']}")
-                else:
-                    yield Static("No tasks for this day", classes="no-tasks")
+                yield from self.create_task_widgets()
             
             with Horizontal(id="modal-footer"):
                 yield Button("Close", id="close", classes="close-button")
@@ -261,13 +225,28 @@ class EditTaskModal(ModalScreen):
             self.dismiss(False)
 
 
+class DateSelected(Message):
+    """Posted when a calendar date button is pressed"""
+
+    def __init__(self, date_info: date) -> None:
+        self.date = date_info
+        super().__init__()
+
+
 class DateButton(Button):
     """Custom button for calendar dates that stores date information"""
     
-    def __init__(self, label: str, date_info: date, **kwargs) -> None:
+    def __init__(self, label: str, date_info: Optional[date], **kwargs) -> None:
         super().__init__(label, **kwargs)
         self.date_info = date_info
 
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Turn the generic press into a DateSelected message"""
+        event.stop()
+        # Empty padding days carry no date
+        if self.date_info is not None:
+            self.post_message(DateSelected(self.date_info))
+
 
 class CalendarScreen(Screen):
     """Calendar screen showing tasks organized by date"""
@@ -279,144 +258,100 @@ class CalendarScreen(Screen):
         Binding("right", "next_month", "Next Month"),
     ]
 
-    CSS = """
-    CalendarScreen {
-        layout: vertical;
-    }
-    
-    #calendar-nav {
-        height: auto;
-        padding: 1 2;
-        background: $panel;
-        layout: horizontal;
-        align: center middle;
-    }
-    
-    #calendar-container {
-        padding: 1 2;
-        overflow-y: auto;
-        height: 1fr;
-    }
-    
-    .calendar-month-header {
-        text-align: center;
-        text-style: bold;
-        color: $accent;
-        padding: 1 0;
-        border-bottom: solid $primary;
-        margin-bottom: 1;
-    }
-    
-    .calendar-week {
-        layout: horizontal;
-        height: 8;
-        width: 100%;
-        margin-bottom: 1;
-    }
-    
-    .calendar-day {
-        width: 1fr;
-        height: 100%;
-        padding: 1;
-        border: solid $primary;
-        background: $surface;
-    }
-    
-    .calendar-day.-today {
-        background: $success;
-        border: solid $accent;
-    }
-    
-    .calendar-day.-other-month {
-        color: $text-muted;
-        background: $panel-darken-1;
-    }
-    
-    .calendar-day.-has-tasks {
-        background: $primary-lighten-2;
-    }
-    
-    .day-number {
-        text-style: bold;
-        text-align: right;
-        padding: 0 1 1 0;
-    }
-    
-    .day-tasks {
-        padding: 1 1;
-        overflow-y: auto;
-    }
-    
-    .task-item {
-        color: $text-muted;
-        padding: 1 0;
-    }
-    
-    .task-item.-completed {
-        text-style: strike;
-        opacity: 0.6;
-    }
-    
-    .nav-button {
-        width: auto;
-        height: 3;
-        margin: 0 1;
-        background: $primary;
-        color: $text;
-    }
-    
-    .nav-button:hover {
-        background: $primary-lighten-1;
-    }
-    
-    .month-display {
-        width: auto;
-        padding: 0 2;
-        text-style: bold;
-        color: $text;
-    }
-    """
+    CSS_PATH = "styles/calendar_screen.tcss"
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self.current_date = date.today()
-        self.db = Database()
-        self.all_tasks = self.get_all_tasks_by_date()
-        
-        
-    def get_all_tasks_by_date(self) -> Dict[str, List[dict]]:
-        """Get all tasks from database grouped by date"""
-        # Get data from database (should return list of tuples)
-        data = self.db.get_all_tasks()
-
+        self._today = date.today()
+        self._day_cache: Dict[date, Tuple[str, str]] = {}
+        self._month_header: Optional[Static] = None
+        self._day_buttons: List[DateButton] = []
+        self._week_rows: List[Horizontal] = []
+        self._modal: Optional[TaskModal] = None
+        self._weekday_headers = [
+            Static(day_name, classes="calendar-day day-header") for day_name in WEEKDAY_NAMES
+        ]
+        # Tasks are loaded by a background worker once the screen is mounted
+        self.all_tasks: Dict[date, List[dict]] = {}
+        self._loading = False
+        self._pending_date: Optional[date] = None
+
+    def on_mount(self) -> None:
+        """Load the current month's tasks without blocking the first render"""
+        self._loading = True
+        self._load_tasks(self.current_date.year, self.current_date.month)
+
+    @work(thread=True, exclusive=True)
+    def _load_tasks(self, year: int, month: int) -> None:
+        """Load a month's tasks in a worker thread and apply them on the UI thread"""
+        # SQLite connections can't be shared between threads, so open one here
+        with Database() as db:
+            data = db.get_tasks_for_month(year, month)
+
+        tasks_by_date = self.group_tasks_by_date(data)
+        day_cache = self.build_day_cache(tasks_by_date)
+
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._apply_tasks, year, month, tasks_by_date, day_cache)
+
+    def _apply_tasks(
+        self,
+        year: int,
+        month: int,
+        tasks_by_date: Dict[date, List[dict]],
+        day_cache: Dict[date, Tuple[str, str]],
+    ) -> None:
+        """Show loaded tasks if their month is still the one on display"""
+        if (year, month) != (self.current_date.year, self.current_date.month):
+            return
+        self.all_tasks = tasks_by_date
+        self._day_cache = day_cache
+        self._loading = False
+        self.update_calendar_cells()
+
+        # Open a date that was pressed while this month was loading
+        pending_date, self._pending_date = self._pending_date, None
+        if pending_date is not None and (pending_date.year, pending_date.month) == (year, month):
+            self.post_message(DateSelected(pending_date))
+
+    def group_tasks_by_date(self, data) -> Dict[date, List[dict]]:
+        """Group a month's task rows by date"""
         # Map the database tuples to dictionaries
-        mapped_tasks = map_tasks(data)
+        mapped_tasks = _map_tuple_tasks(data)
 
-        # Group tasks by date
+        # Rows are sorted by date_time, so group consecutive tasks by the date part
         tasks_by_date = {}
-        for task in mapped_tasks:
-            if task["date_time"]:
-                # Extract date part from datetime string
-                task_date = task["date_time"].split(" ")[0]
-                if task_date not in tasks_by_date:
-                    tasks_by_date[task_date] = []
-                tasks_by_date[task_date].append(task)
+        for date_str, day_tasks in groupby(mapped_tasks, key=lambda t: t["date_time"][:10]):
+            # Only strict YYYY-MM-DD keys; int() would accept padded fields like "3 "
+            year, month, day = date_str[:4], date_str[5:7], date_str[8:10]
+            if not (
+                len(date_str) == 10
+                and date_str[4] == date_str[7] == "-"
+                and (year + month + day).isdigit()
+            ):
+                continue  # Skip malformed dates
+            try:
+                task_date = date(int(year), int(month), int(day))
+            except ValueError:
+                continue  # Skip impossible dates such as 2026-02-30
+            # Separate groups can map to the same date, so merge rather than overwrite
+            tasks_by_date.setdefault(task_date, []).extend(day_tasks)
 
         return tasks_by_date
 
-    
-    def get_month_dates(self, year: int, month: int) -> List[date]:
-        """Get all dates for a given month"""
-        first_day = date(year, month, 1)
-        last_day = date(year, month, monthrange(year, month)[1])
-        
-        dates = []
-        current_date = first_day
-        while current_date <= last_day:
-            dates.append(current_date)
-            current_date += timedelta(days=1)
-        
-        return dates
+    def build_day_cache(self, tasks_by_date: Dict[date, List[dict]]) -> Dict[date, Tuple[str, str]]:
+        """Precompute the class suffix and preview content for every day with tasks"""
+        day_cache = {}
+        for day_date, day_tasks in tasks_by_date.items():
+            parts = [f"[bold]{day_date.day}[/bold]"]
+            # Show max 2 tasks preview
+            parts.extend(f"{task['status_symbol']} {task['title'][:12]}" for task in day_tasks[:2])
+            if len(day_tasks) > 2:
+                parts.append(f"+{len(day_tasks) - 2} more")
+            day_cache[day_date] = (" -has-tasks", "\n".join(parts))
+
+        return day_cache
     
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -440,27 +375,50 @@ class CalendarScreen(Screen):
                 self.current_date.month
             )
 
+    async def on_date_selected(self, event: DateSelected) -> None:
+        """Open a modal with the tasks of the selected date"""
+        # A second press can arrive before the shared modal is shown
+        if self._modal is not None and self._modal in self.app.screen_stack:
+            return
+
+        # Tasks for the month are still loading; open the date once they arrive
+        if self._loading:
+            self._pending_date = event.date
+            return
+
+        selected_date = event.date
+        date_tasks = self.all_tasks.get(selected_date, [])
+
+        # Open modal with tasks for this date
+        def modal_callback(refresh: bool):
+            if refresh:
+                self.refresh_calendar()
+
+        # Re-use one modal per calendar instead of composing a new one per click
+        if self._modal is None:
+            self._modal = TaskModal(date_tasks, selected_date)
+            self.app.install_screen(self._modal, f"task-modal-{id(self)}")
+        else:
+            await self._modal.update(date_tasks, selected_date)
+        self.app.push_screen(self._modal, modal_callback)
+
+    def on_unmount(self) -> None:
+        """Release the cached task modal along with the calendar"""
+        # The modal can still be on the stack if the whole app is shutting down
+        if self._modal is not None and self._modal not in self.app.screen_stack:
+            self.app.uninstall_screen(self._modal)
+            if self._modal.is_mounted:
+                self._modal.remove()
+            self._modal = None
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle navigation button presses and date button presses"""
+        """Handle navigation button presses"""
         if event.button.id == "home-button":
             # Return to home screen using the same logic as keyboard shortcut
             self.action_go_home()
         elif event.button.id == "settings-button":
             # Open settings modal using the same logic as keyboard shortcut
             self.action_open_settings()
-        elif hasattr(event.button, 'date_info'):
-            # This is a date button
-            selected_date = event.button.date_info
-            date_str = selected_date.strftime('%Y-%m-%d')
-            date_tasks = self.all_tasks.get(date_str, [])
-
-            # Open modal with tasks for this date
-            def modal_callback(refresh: bool):
-                if refresh:
-                    self.refresh_calendar()
-
-            modal = TaskModal(date_tasks, selected_date)
-            self.app.push_screen(modal, modal_callback)
         elif event.button.id in ["prev-month", "next-month"]:
             # Handle navigation buttons using action methods
             if event.button.id == "prev-month":
@@ -505,121 +463,104 @@ class CalendarScreen(Screen):
             )
         self.refresh_calendar()
 
+    def get_month_weeks(self, year: int, month: int) -> Tuple[Tuple[Optional[date], ...], ...]:
+        """Group the dates of a month into weeks, padded with None"""
+        return _month_structure(year, month)
+
     def create_calendar_widgets(self, year: int, month: int):
         """Yield calendar widgets for a specific month"""
         # Month header
-        yield Static(
+        self._month_header = Static(
             f"{date(year, month, 1).strftime('%B %Y')}", 
             classes="calendar-month-header"
         )
+        yield self._month_header
         
-        # Weekday headers
-        weekdays = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+        # Weekday headers (composed once; refresh_calendar never tears them down)
         with Horizontal(classes="calendar-week"):
-            for day_name in weekdays:
-                yield Static(day_name, classes="calendar-day day-header")
-        
-        # Get all dates for the month
-        month_dates = self.get_month_dates(year, month)
+            yield from self._weekday_headers
         
-        # Group dates by week
-        weeks = []
-        current_week = []
+        weeks = self.get_month_weeks(year, month)
         
-        # Add empty slots for days before the first of the month
-        first_day_weekday = date(year, month, 1).weekday()
-        for i in range(first_day_weekday):
-            current_week.append(None)
-        
-        # Add actual dates
-        for d in month_dates:
-            current_week.append(d)
-            if len(current_week) == 7:
-                weeks.append(current_week)
-                current_week = []
-        
-        # Fill last week
-        if current_week:
-            while len(current_week) < 7:
-                current_week.append(None)
-            weeks.append(current_week)
-        
-        # Create calendar weeks
-        for week in weeks:
-            with Horizontal(classes="calendar-week"):
+        # Create a fixed pool of calendar weeks; weeks the month doesn't use are hidden
+        self._day_buttons = []
+        self._week_rows = []
+        for week_index in range(CALENDAR_WEEKS):
+            week = weeks[week_index] if week_index < len(weeks) else [None] * 7
+            with Horizontal(classes="calendar-week") as week_row:
                 for day_date in week:
-                    yield self.create_day_widget(day_date)
-
-    def create_day_widget(self, day_date: date):
-        """Create a widget for a single day with its tasks"""
+                    day_button = self.create_day_widget(day_date)
+                    self._day_buttons.append(day_button)
+                    yield day_button
+            week_row.display = week_index < len(weeks)
+            self._week_rows.append(week_row)
+
+    def get_day_state(self, day_date: Optional[date]) -> Tuple[str, str]:
+        """Get the label and state classes for a single day"""
         if day_date is None:
             # Empty day
-            return Static("", classes="calendar-day -other-month")
-        
-        # Day number
-        day_str = str(day_date.day)
+            return "", "-other-month"
         
         # Determine CSS classes
-        day_classes = "calendar-day"
-        if day_date == date.today():
+        day_classes = ""
+        if day_date == self._today:
             day_classes += " -today"
         elif day_date.month != self.current_date.month:
             day_classes += " -other-month"
-        
-        # Get tasks for this day
-        date_str = day_date.strftime('%Y-%m-%d')
-        day_tasks = self.all_tasks.get(date_str, [])
-        
-        if day_tasks:
-            day_classes += " -has-tasks"
-        
-        # Build day content
-        content = f"[bold]{day_str}[/bold]\n"
-        if day_tasks:
-            for task in day_tasks[:2]:  # Show max 2 tasks preview
-                status = "✅" if task.get("status") and task["status"].lower() == "completed" else "⏳"
-                content += f"{status} {task['title'][:12]}\n"
-            if len(day_tasks) > 2:
-                content += f"+{len(day_tasks) - 2} more"
-        
+
+        # Cached class suffix and content for days with tasks
+        cached = self._day_cache.get(day_date)
+        if cached:
+            task_classes, content = cached
+            day_classes += task_classes
+        else:
+            content = f"[bold]{day_date.day}[/bold]"
+
+        return content, day_classes.strip()
+
+    def create_day_widget(self, day_date: Optional[date]):
+        """Create a widget for a single day with its tasks"""
+        content, day_classes = self.get_day_state(day_date)
+
         # Create button widget with date info
-        return DateButton(content.strip(), date_info=day_date, classes=day_classes)
+        return DateButton(content, date_info=day_date, classes=f"calendar-day {day_classes}")
+
+    def update_day_widget(self, day_button: DateButton, day_date: Optional[date]) -> None:
+        """Re-label an existing day button for a new date"""
+        content, day_classes = self.get_day_state(day_date)
+        state_classes = day_classes.split()
+
+        day_button.label = content
+        day_button.date_info = day_date
+        # Toggle only the day state classes so the button keeps its own variant classes
+        for class_name in DAY_STATE_CLASSES:
+            day_button.set_class(class_name in state_classes, class_name)
+
+    def update_calendar_cells(self) -> None:
+        """Update the existing day widgets in place for the current month"""
+        weeks = self.get_month_weeks(self.current_date.year, self.current_date.month)
+        for week_index, week_row in enumerate(self._week_rows):
+            week = weeks[week_index] if week_index < len(weeks) else [None] * 7
+            week_row.display = week_index < len(weeks)
+            week_buttons = self._day_buttons[week_index * 7:(week_index + 1) * 7]
+            for day_button, day_date in zip(week_buttons, week):
+                self.update_day_widget(day_button, day_date)
 
     def refresh_calendar(self):
         """Refresh the calendar display"""
-        # Reload tasks
-        self.all_tasks = self.get_all_tasks_by_date()
-
-        # Remove and rebuild calendar
-        calendar_container = self.query_one("#calendar-container", ScrollableContainer)
-        calendar_container.remove_children()
-
-        # Mount new widgets using compose-style mounting
-        try:
-            # Create a temporary list to hold widgets
-            widgets = []
-            for widget in self.create_calendar_widgets(
-                self.current_date.year,
-                self.current_date.month
-            ):
-                widgets.append(widget)
+        year, month = self.current_date.year, self.current_date.month
 
-            # Mount all widgets at once
-            calendar_container.compose_add_child(*widgets)
-        except Exception as e:
-            # Fallback: recreate the entire screen if mounting fails
-            try:
-                self.app.pop_screen()
-                new_calendar = CalendarScreen()
-                new_calendar.current_date = self.current_date  # Preserve the date
-                self.app.push_screen(new_calendar)
-            except Exception:
-                pass  # If all else fails, just continue
-            return
+        # Render the month straight away and let the worker fill in its tasks.
+        # The current tasks stay until the worker replaces them; cached days of
+        # another month don't match any date in the new grid.
+        self._month_header.update(f"{date(year, month, 1).strftime('%B %Y')}")
+        self.update_calendar_cells()
+        self._loading = True
+        self._load_tasks(year, month)
 
         # Update month display in header navigation
         try:
             month_display = self.query_one("#month-display", Static)
             month_display.update(f"{self.current_date.strftime('%B %Y')}")
         except Exception:
-            pass  # If element not found, continue silently
\ No newline at end of file
+            pass  # If element not found, continue silently
@@ -0,0 +1,124 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from schedulr.core import Database
+from schedulr.screens import CalendarScreen, _month_structure
+
+class TestGetTasksForMonth(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = Database(os.path.join(self.tmp_dir, "test.db"))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_returns_only_tasks_in_month(self):
+        self.db.create_task("Before", "2026-09-30 23:59:59")
+        self.db.create_task("First", "2026-10-01 00:00:00")
+        self.db.create_task("Last", "2026-10-31 23:59:59")
+        self.db.create_task("After", "2026-11-01 00:00:00")
+
+        titles = [row[1] for row in self.db.get_tasks_for_month(2026, 10)]
+        self.assertEqual(titles, ["First", "Last"])
+
+    def test_december_rolls_over_to_january(self):
+        self.db.create_task("Nov", "2026-11-30 12:00:00")
+        self.db.create_task("Dec", "2026-12-31 12:00:00")
+        self.db.create_task("Jan", "2027-01-01 00:00:00")
+
+        titles = [row[1] for row in self.db.get_tasks_for_month(2026, 12)]
+        self.assertEqual(titles, ["Dec"])
+
+    def test_ordered_by_date_time(self):
+        self.db.create_task("Late", "2026-10-20 18:00:00")
+        self.db.create_task("Early", "2026-10-03 09:00:00")
+        self.db.create_task("Noon", "2026-10-03 12:00:00")
+
+        rows = self.db.get_tasks_for_month(2026, 10)
+        self.assertEqual([row[1] for row in rows], ["Early", "Noon", "Late"])
+        self.assertEqual(tuple(rows[0]), (2, "Early", "2026-10-03 09:00:00", "Pending"))
+
+    def test_empty_month(self):
+        self.db.create_task("Other", "2026-10-03 09:00:00")
+        self.assertEqual(self.db.get_tasks_for_month(2026, 2), [])
+
+class TestMonthStructure(unittest.TestCase):
+    def test_month_starting_on_monday(self):
+        weeks = _month_structure(2027, 2)  # Feb 2027: Monday 1st, 28 days
+        self.assertEqual(len(weeks), 4)
+        self.assertEqual(weeks[0][0], date(2027, 2, 1))
+        self.assertEqual(weeks[-1][-1], date(2027, 2, 28))
+
+    def test_padding_before_and_after(self):
+        weeks = _month_structure(2026, 10)  # Oct 2026: Thursday 1st, 31 days
+        self.assertEqual(len(weeks), 5)
+        self.assertEqual(weeks[0][:3], (None, None, None))
+        self.assertEqual(weeks[0][3], date(2026, 10, 1))
+        self.assertEqual(weeks[-1][5], date(2026, 10, 31))
+        self.assertIsNone(weeks[-1][6])
+
+    def test_six_week_month(self):
+        weeks = _month_structure(2026, 8)  # Aug 2026: Saturday 1st, 31 days
+        self.assertEqual(len(weeks), 6)
+        self.assertEqual(weeks[-1][0], date(2026, 8, 31))
+
+    def test_every_day_appears_once(self):
+        for month in range(1, 13):
+            weeks = _month_structure(2024, month)
+            days = [d for week in weeks for d in week if d is not None]
+            self.assertTrue(all(len(week) == 7 for week in weeks))
+            self.assertEqual(days[0], date(2024, month, 1))
+            self.assertEqual([d.day for d in days], list(range(1, len(days) + 1)))
+
+class TestGroupTasksByDate(unittest.TestCase):
+    def setUp(self):
+        self.calendar = CalendarScreen()
+
+    def test_groups_sorted_rows_by_date(self):
+        rows = [
+            (1, "A", "2026-10-03 09:00:00", "Pending"),
+            (2, "B", "2026-10-03 12:00:00", "Completed"),
+            (3, "C", "2026-10-04 08:00:00", "Pending"),
+        ]
+        tasks_by_date = self.calendar.group_tasks_by_date(rows)
+
+        self.assertEqual(list(tasks_by_date), [date(2026, 10, 3), date(2026, 10, 4)])
+        self.assertEqual([t["id"] for t in tasks_by_date[date(2026, 10, 3)]], [1, 2])
+        self.assertTrue(tasks_by_date[date(2026, 10, 3)][1]["is_completed"])
+        self.assertEqual(tasks_by_date[date(2026, 10, 4)][0]["status_symbol"], "⏳")
+
+    def test_skips_malformed_dates(self):
+        rows = [
+            (1, "Bad", "2026-1-3 09:00", "Pending"),
+            (2, "Invalid", "2026-02-30 09:00:00", "Pending"),
+            (3, "Good", "2026-10-05 09:00:00", "Pending"),
+        ]
+        tasks_by_date = self.calendar.group_tasks_by_date(rows)
+        self.assertEqual(list(tasks_by_date), [date(2026, 10, 5)])
+
+    def test_unpadded_row_does_not_replace_padded_day(self):
+        # AddTaskModal accepts "2026-10-3", which SQLite sorts after "2026-10-20"
+        rows = [
+            (1, "Padded", "2026-10-03 09:00:00", "Pending"),
+            (2, "Other", "2026-10-20 09:00:00", "Pending"),
+            (3, "Unpadded", "2026-10-3 12:00:00", "Pending"),
+        ]
+        tasks_by_date = self.calendar.group_tasks_by_date(rows)
+
+        self.assertEqual([t["title"] for t in tasks_by_date[date(2026, 10, 3)]], ["Padded"])
+        self.assertEqual([t["title"] for t in tasks_by_date[date(2026, 10, 20)]], ["Other"])
+
+    def test_merges_separate_groups_for_same_date(self):
+        rows = [
+            (1, "A", "2026-10-03 09:00:00", "Pending"),
+            (2, "B", "2026-10-04 09:00:00", "Pending"),
+            (3, "C", "2026-10-03 12:00:00", "Pending"),
+        ]
+        tasks_by_date = self.calendar.group_tasks_by_date(rows)
+        self.assertEqual([t["id"] for t in tasks_by_date[date(2026, 10, 3)]], [1, 3])
+
+if __name__ == '__main__':
+    unittest.main()